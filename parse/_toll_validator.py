@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# This file is part of TollData - Open French Highway Toll Database
+# Fichier généré par gen_toll_validator.py depuis toll_network_schema.json
+# NE PAS MODIFIER À LA MAIN.
+# flake8: noqa
+
+SCHEMA_SHA256 = "51ec979a523d68f7bd653a8fff04e6745edfb0d36597571403a50150876c8ccf"
+
+VERSION = "2.22.2"
+from decimal import Decimal
+import re
+from fastjsonschema import JsonSchemaValueException, JsonSchemaValuesException
+
+
+REGEX_PATTERNS = {
+    '^\\d{2}/\\d{2}/\\d{4}$': re.compile('^\\d{2}/\\d{2}/\\d{4}\\Z'),
+    '^[A-Z0-9 _-]+$': re.compile('^[A-Z0-9 _-]+$'),
+    '^[A-Z]{3}$': re.compile('^[A-Z]{3}\\Z'),
+    '^[0-9]+$': re.compile('^[0-9]+\\Z'),
+    '^(\\d+(\\.\\d+)?)?$': re.compile('^(\\d+(\\.\\d+)?)?\\Z'),
+    '^\\d+(\\.\\d+)?$': re.compile('^\\d+(\\.\\d+)?\\Z')
+}
+
+NoneType = type(None)
+
+def validate_https___example_com_toll_network_schema_json(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/toll-network.schema.json', 'title': 'Toll Network Data', 'description': 'Schema for toll network pricing and topology data', 'type': 'object', 'required': ['date', 'version', 'name', 'list_of_operator', 'list_of_toll', 'currency', 'networks', 'toll_description', 'open_toll_price'], 'properties': {'date': {'type': 'string', 'pattern': '^\\d{2}/\\d{2}/\\d{4}$', 'description': 'Date in DD/MM/YYYY format'}, 'version': {'type': 'string', 'description': 'Version of the data format'}, 'name': {'type': 'string', 'description': 'Name of the pricing format'}, 'list_of_operator': {'type': 'array', 'description': 'List of toll operators', 'items': {'type': 'string'}, 'uniqueItems': True}, 'list_of_toll': {'type': 'array', 'description': 'List of all toll names', 'items': {'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, 'uniqueItems': True}, 'currency': {'type': 'string', 'pattern': '^[A-Z]{3}$', 'description': 'ISO 4217 currency code (e.g., EUR, USD)'}, 'networks': {'type': 'array', 'description': 'Connected components of closed toll networks', 'items': {'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'toll_description': {'type': 'object', 'description': 'Detailed information about each toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'open_toll_price': {'type': 'object', 'description': 'Pricing for open (flat rate) tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False, 'definitions': {'edge': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'priceClasses': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['date', 'version', 'name', 'list_of_operator', 'list_of_toll', 'currency', 'networks', 'toll_description', 'open_toll_price']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/toll-network.schema.json', 'title': 'Toll Network Data', 'description': 'Schema for toll network pricing and topology data', 'type': 'object', 'required': ['date', 'version', 'name', 'list_of_operator', 'list_of_toll', 'currency', 'networks', 'toll_description', 'open_toll_price'], 'properties': {'date': {'type': 'string', 'pattern': '^\\d{2}/\\d{2}/\\d{4}$', 'description': 'Date in DD/MM/YYYY format'}, 'version': {'type': 'string', 'description': 'Version of the data format'}, 'name': {'type': 'string', 'description': 'Name of the pricing format'}, 'list_of_operator': {'type': 'array', 'description': 'List of toll operators', 'items': {'type': 'string'}, 'uniqueItems': True}, 'list_of_toll': {'type': 'array', 'description': 'List of all toll names', 'items': {'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, 'uniqueItems': True}, 'currency': {'type': 'string', 'pattern': '^[A-Z]{3}$', 'description': 'ISO 4217 currency code (e.g., EUR, USD)'}, 'networks': {'type': 'array', 'description': 'Connected components of closed toll networks', 'items': {'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'toll_description': {'type': 'object', 'description': 'Detailed information about each toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'open_toll_price': {'type': 'object', 'description': 'Pricing for open (flat rate) tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False, 'definitions': {'edge': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'priceClasses': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}}, rule='required')
+        data_keys = set(data.keys())
+        if "date" in data_keys:
+            data_keys.remove("date")
+            data__date = data["date"]
+            if not isinstance(data__date, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".date must be string", value=data__date, name="" + (name_prefix or "data") + ".date", definition={'type': 'string', 'pattern': '^\\d{2}/\\d{2}/\\d{4}$', 'description': 'Date in DD/MM/YYYY format'}, rule='type')
+            if isinstance(data__date, str):
+                if not REGEX_PATTERNS['^\\d{2}/\\d{2}/\\d{4}$'].search(data__date):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".date must match pattern ^\\d{2}/\\d{2}/\\d{4}$", value=data__date, name="" + (name_prefix or "data") + ".date", definition={'type': 'string', 'pattern': '^\\d{2}/\\d{2}/\\d{4}$', 'description': 'Date in DD/MM/YYYY format'}, rule='pattern')
+        if "version" in data_keys:
+            data_keys.remove("version")
+            data__version = data["version"]
+            if not isinstance(data__version, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".version must be string", value=data__version, name="" + (name_prefix or "data") + ".version", definition={'type': 'string', 'description': 'Version of the data format'}, rule='type')
+        if "name" in data_keys:
+            data_keys.remove("name")
+            data__name = data["name"]
+            if not isinstance(data__name, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".name must be string", value=data__name, name="" + (name_prefix or "data") + ".name", definition={'type': 'string', 'description': 'Name of the pricing format'}, rule='type')
+        if "list_of_operator" in data_keys:
+            data_keys.remove("list_of_operator")
+            data__listofoperator = data["list_of_operator"]
+            if not isinstance(data__listofoperator, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_operator must be array", value=data__listofoperator, name="" + (name_prefix or "data") + ".list_of_operator", definition={'type': 'array', 'description': 'List of toll operators', 'items': {'type': 'string'}, 'uniqueItems': True}, rule='type')
+            data__listofoperator_is_list = isinstance(data__listofoperator, (list, tuple))
+            if data__listofoperator_is_list:
+                def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                data__listofoperator_len = len(data__listofoperator)
+                if data__listofoperator_len > len(set(fn(data__listofoperator_x) for data__listofoperator_x in data__listofoperator)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_operator must contain unique items", value=data__listofoperator, name="" + (name_prefix or "data") + ".list_of_operator", definition={'type': 'array', 'description': 'List of toll operators', 'items': {'type': 'string'}, 'uniqueItems': True}, rule='uniqueItems')
+                for data__listofoperator_x, data__listofoperator_item in enumerate(data__listofoperator):
+                    if not isinstance(data__listofoperator_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_operator[{data__listofoperator_x}]".format(**locals()) + " must be string", value=data__listofoperator_item, name="" + (name_prefix or "data") + ".list_of_operator[{data__listofoperator_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+        if "list_of_toll" in data_keys:
+            data_keys.remove("list_of_toll")
+            data__listoftoll = data["list_of_toll"]
+            if not isinstance(data__listoftoll, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_toll must be array", value=data__listoftoll, name="" + (name_prefix or "data") + ".list_of_toll", definition={'type': 'array', 'description': 'List of all toll names', 'items': {'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, 'uniqueItems': True}, rule='type')
+            data__listoftoll_is_list = isinstance(data__listoftoll, (list, tuple))
+            if data__listoftoll_is_list:
+                def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                data__listoftoll_len = len(data__listoftoll)
+                if data__listoftoll_len > len(set(fn(data__listoftoll_x) for data__listoftoll_x in data__listoftoll)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_toll must contain unique items", value=data__listoftoll, name="" + (name_prefix or "data") + ".list_of_toll", definition={'type': 'array', 'description': 'List of all toll names', 'items': {'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, 'uniqueItems': True}, rule='uniqueItems')
+                for data__listoftoll_x, data__listoftoll_item in enumerate(data__listoftoll):
+                    if not isinstance(data__listoftoll_item, (str)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_toll[{data__listoftoll_x}]".format(**locals()) + " must be string", value=data__listoftoll_item, name="" + (name_prefix or "data") + ".list_of_toll[{data__listoftoll_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, rule='type')
+                    if isinstance(data__listoftoll_item, str):
+                        if not REGEX_PATTERNS['^[A-Z0-9 _-]+$'].search(data__listoftoll_item):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".list_of_toll[{data__listoftoll_x}]".format(**locals()) + " must match pattern ^[A-Z0-9 _-]+$", value=data__listoftoll_item, name="" + (name_prefix or "data") + ".list_of_toll[{data__listoftoll_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, rule='pattern')
+        if "currency" in data_keys:
+            data_keys.remove("currency")
+            data__currency = data["currency"]
+            if not isinstance(data__currency, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".currency must be string", value=data__currency, name="" + (name_prefix or "data") + ".currency", definition={'type': 'string', 'pattern': '^[A-Z]{3}$', 'description': 'ISO 4217 currency code (e.g., EUR, USD)'}, rule='type')
+            if isinstance(data__currency, str):
+                if not REGEX_PATTERNS['^[A-Z]{3}$'].search(data__currency):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".currency must match pattern ^[A-Z]{3}$", value=data__currency, name="" + (name_prefix or "data") + ".currency", definition={'type': 'string', 'pattern': '^[A-Z]{3}$', 'description': 'ISO 4217 currency code (e.g., EUR, USD)'}, rule='pattern')
+        if "networks" in data_keys:
+            data_keys.remove("networks")
+            data__networks = data["networks"]
+            if not isinstance(data__networks, (list, tuple)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks must be array", value=data__networks, name="" + (name_prefix or "data") + ".networks", definition={'type': 'array', 'description': 'Connected components of closed toll networks', 'items': {'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, rule='type')
+            data__networks_is_list = isinstance(data__networks, (list, tuple))
+            if data__networks_is_list:
+                data__networks_len = len(data__networks)
+                for data__networks_x, data__networks_item in enumerate(data__networks):
+                    if not isinstance(data__networks_item, (dict)):
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + " must be object", value=data__networks_item, name="" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+                    data__networks_item_is_dict = isinstance(data__networks_item, dict)
+                    if data__networks_item_is_dict:
+                        data__networks_item__missing_keys = set(['network_name', 'tolls', 'connection']) - data__networks_item.keys()
+                        if data__networks_item__missing_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + " must contain " + (str(sorted(data__networks_item__missing_keys)) + " properties"), value=data__networks_item, name="" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='required')
+                        data__networks_item_keys = set(data__networks_item.keys())
+                        if "network_name" in data__networks_item_keys:
+                            data__networks_item_keys.remove("network_name")
+                            data__networks_item__networkname = data__networks_item["network_name"]
+                            if not isinstance(data__networks_item__networkname, (str)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].network_name".format(**locals()) + " must be string", value=data__networks_item__networkname, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].network_name".format(**locals()) + "", definition={'type': 'string', 'description': 'Network identifier'}, rule='type')
+                        if "tolls" in data__networks_item_keys:
+                            data__networks_item_keys.remove("tolls")
+                            data__networks_item__tolls = data__networks_item["tolls"]
+                            if not isinstance(data__networks_item__tolls, (list, tuple)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + " must be array", value=data__networks_item__tolls, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + "", definition={'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, rule='type')
+                            data__networks_item__tolls_is_list = isinstance(data__networks_item__tolls, (list, tuple))
+                            if data__networks_item__tolls_is_list:
+                                data__networks_item__tolls_len = len(data__networks_item__tolls)
+                                if data__networks_item__tolls_len < 1:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + " must contain at least 1 items", value=data__networks_item__tolls, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + "", definition={'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, rule='minItems')
+                                def fn(var): return frozenset(dict((k, fn(v)) for k, v in var.items()).items()) if hasattr(var, "items") else tuple(fn(v) for v in var) if isinstance(var, (dict, list)) else str(var) if isinstance(var, bool) else var
+                                if data__networks_item__tolls_len > len(set(fn(data__networks_item__tolls_x) for data__networks_item__tolls_x in data__networks_item__tolls)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + " must contain unique items", value=data__networks_item__tolls, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls".format(**locals()) + "", definition={'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, rule='uniqueItems')
+                                for data__networks_item__tolls_x, data__networks_item__tolls_item in enumerate(data__networks_item__tolls):
+                                    if not isinstance(data__networks_item__tolls_item, (str)):
+                                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls[{data__networks_item__tolls_x}]".format(**locals()) + " must be string", value=data__networks_item__tolls_item, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].tolls[{data__networks_item__tolls_x}]".format(**locals()) + "", definition={'type': 'string'}, rule='type')
+                        if "connection" in data__networks_item_keys:
+                            data__networks_item_keys.remove("connection")
+                            data__networks_item__connection = data__networks_item["connection"]
+                            if not isinstance(data__networks_item__connection, (dict)):
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].connection".format(**locals()) + " must be object", value=data__networks_item__connection, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].connection".format(**locals()) + "", definition={'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+                            data__networks_item__connection_is_dict = isinstance(data__networks_item__connection, dict)
+                            if data__networks_item__connection_is_dict:
+                                data__networks_item__connection_keys = set(data__networks_item__connection.keys())
+                                for data__networks_item__connection_key, data__networks_item__connection_val in data__networks_item__connection.items():
+                                    if REGEX_PATTERNS['^[A-Z0-9 _-]+$'].search(data__networks_item__connection_key):
+                                        if data__networks_item__connection_key in data__networks_item__connection_keys:
+                                            data__networks_item__connection_keys.remove(data__networks_item__connection_key)
+                                        if not isinstance(data__networks_item__connection_val, (dict)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].connection.{data__networks_item__connection_key}".format(**locals()) + " must be object", value=data__networks_item__connection_val, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].connection.{data__networks_item__connection_key}".format(**locals()) + "", definition={'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+                                        data__networks_item__connection_val_is_dict = isinstance(data__networks_item__connection_val, dict)
+                                        if data__networks_item__connection_val_is_dict:
+                                            data__networks_item__connection_val_keys = set(data__networks_item__connection_val.keys())
+                                            for data__networks_item__connection_val_key, data__networks_item__connection_val_val in data__networks_item__connection_val.items():
+                                                if REGEX_PATTERNS['^[A-Z0-9 _-]+$'].search(data__networks_item__connection_val_key):
+                                                    if data__networks_item__connection_val_key in data__networks_item__connection_val_keys:
+                                                        data__networks_item__connection_val_keys.remove(data__networks_item__connection_val_key)
+                                                    validate_https___example_com_toll_network_schema_json__definitions_edge(data__networks_item__connection_val_val, custom_formats, (name_prefix or "data") + ".networks[{data__networks_x}].connection.{data__networks_item__connection_key}.{data__networks_item__connection_val_key}".format(**locals()))
+                                            if data__networks_item__connection_val_keys:
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].connection.{data__networks_item__connection_key}".format(**locals()) + " must not contain "+str(data__networks_item__connection_val_keys)+" properties", value=data__networks_item__connection_val, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].connection.{data__networks_item__connection_key}".format(**locals()) + "", definition={'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+                                if data__networks_item__connection_keys:
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}].connection".format(**locals()) + " must not contain "+str(data__networks_item__connection_keys)+" properties", value=data__networks_item__connection, name="" + (name_prefix or "data") + ".networks[{data__networks_x}].connection".format(**locals()) + "", definition={'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+                        if data__networks_item_keys:
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + " must not contain "+str(data__networks_item_keys)+" properties", value=data__networks_item, name="" + (name_prefix or "data") + ".networks[{data__networks_x}]".format(**locals()) + "", definition={'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+        if "toll_description" in data_keys:
+            data_keys.remove("toll_description")
+            data__tolldescription = data["toll_description"]
+            if not isinstance(data__tolldescription, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description must be object", value=data__tolldescription, name="" + (name_prefix or "data") + ".toll_description", definition={'type': 'object', 'description': 'Detailed information about each toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+            data__tolldescription_is_dict = isinstance(data__tolldescription, dict)
+            if data__tolldescription_is_dict:
+                data__tolldescription_keys = set(data__tolldescription.keys())
+                for data__tolldescription_key, data__tolldescription_val in data__tolldescription.items():
+                    if REGEX_PATTERNS['^[A-Z0-9 _-]+$'].search(data__tolldescription_key):
+                        if data__tolldescription_key in data__tolldescription_keys:
+                            data__tolldescription_keys.remove(data__tolldescription_key)
+                        if not isinstance(data__tolldescription_val, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + " must be object", value=data__tolldescription_val, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}, rule='type')
+                        data__tolldescription_val_is_dict = isinstance(data__tolldescription_val, dict)
+                        if data__tolldescription_val_is_dict:
+                            data__tolldescription_val__missing_keys = set(['type']) - data__tolldescription_val.keys()
+                            if data__tolldescription_val__missing_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + " must contain " + (str(sorted(data__tolldescription_val__missing_keys)) + " properties"), value=data__tolldescription_val, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}, rule='required')
+                            data__tolldescription_val_keys = set(data__tolldescription_val.keys())
+                            if "operator_ref" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("operator_ref")
+                                data__tolldescription_val__operatorref = data__tolldescription_val["operator_ref"]
+                                if not isinstance(data__tolldescription_val__operatorref, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.operator_ref".format(**locals()) + " must be string", value=data__tolldescription_val__operatorref, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.operator_ref".format(**locals()) + "", definition={'type': 'string', 'description': 'Operator reference code'}, rule='type')
+                            if "lat" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("lat")
+                                data__tolldescription_val__lat = data__tolldescription_val["lat"]
+                                if not isinstance(data__tolldescription_val__lat, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.lat".format(**locals()) + " must be string", value=data__tolldescription_val__lat, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.lat".format(**locals()) + "", definition={'type': 'string', 'description': 'Latitude coordinate'}, rule='type')
+                            if "lon" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("lon")
+                                data__tolldescription_val__lon = data__tolldescription_val["lon"]
+                                if not isinstance(data__tolldescription_val__lon, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.lon".format(**locals()) + " must be string", value=data__tolldescription_val__lon, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.lon".format(**locals()) + "", definition={'type': 'string', 'description': 'Longitude coordinate'}, rule='type')
+                            if "operator" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("operator")
+                                data__tolldescription_val__operator = data__tolldescription_val["operator"]
+                                if not isinstance(data__tolldescription_val__operator, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.operator".format(**locals()) + " must be string", value=data__tolldescription_val__operator, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.operator".format(**locals()) + "", definition={'type': 'string', 'description': 'Operator name from OSM'}, rule='type')
+                            if "type" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("type")
+                                data__tolldescription_val__type = data__tolldescription_val["type"]
+                                if not isinstance(data__tolldescription_val__type, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.type".format(**locals()) + " must be string", value=data__tolldescription_val__type, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.type".format(**locals()) + "", definition={'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, rule='type')
+                                if not (isinstance(data__tolldescription_val__type, str) and data__tolldescription_val__type == 'open' or isinstance(data__tolldescription_val__type, str) and data__tolldescription_val__type == 'close'):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.type".format(**locals()) + " must be one of ['open', 'close']", value=data__tolldescription_val__type, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.type".format(**locals()) + "", definition={'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, rule='enum')
+                            if "node_id" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("node_id")
+                                data__tolldescription_val__nodeid = data__tolldescription_val["node_id"]
+                                if not isinstance(data__tolldescription_val__nodeid, (list, tuple)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id".format(**locals()) + " must be array", value=data__tolldescription_val__nodeid, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id".format(**locals()) + "", definition={'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, rule='type')
+                                data__tolldescription_val__nodeid_is_list = isinstance(data__tolldescription_val__nodeid, (list, tuple))
+                                if data__tolldescription_val__nodeid_is_list:
+                                    data__tolldescription_val__nodeid_len = len(data__tolldescription_val__nodeid)
+                                    for data__tolldescription_val__nodeid_x, data__tolldescription_val__nodeid_item in enumerate(data__tolldescription_val__nodeid):
+                                        if not isinstance(data__tolldescription_val__nodeid_item, (str)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id[{data__tolldescription_val__nodeid_x}]".format(**locals()) + " must be string", value=data__tolldescription_val__nodeid_item, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id[{data__tolldescription_val__nodeid_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[0-9]+$'}, rule='type')
+                                        if isinstance(data__tolldescription_val__nodeid_item, str):
+                                            if not REGEX_PATTERNS['^[0-9]+$'].search(data__tolldescription_val__nodeid_item):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id[{data__tolldescription_val__nodeid_x}]".format(**locals()) + " must match pattern ^[0-9]+$", value=data__tolldescription_val__nodeid_item, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.node_id[{data__tolldescription_val__nodeid_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[0-9]+$'}, rule='pattern')
+                            if "ways_id" in data__tolldescription_val_keys:
+                                data__tolldescription_val_keys.remove("ways_id")
+                                data__tolldescription_val__waysid = data__tolldescription_val["ways_id"]
+                                if not isinstance(data__tolldescription_val__waysid, (list, tuple)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id".format(**locals()) + " must be array", value=data__tolldescription_val__waysid, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id".format(**locals()) + "", definition={'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, rule='type')
+                                data__tolldescription_val__waysid_is_list = isinstance(data__tolldescription_val__waysid, (list, tuple))
+                                if data__tolldescription_val__waysid_is_list:
+                                    data__tolldescription_val__waysid_len = len(data__tolldescription_val__waysid)
+                                    for data__tolldescription_val__waysid_x, data__tolldescription_val__waysid_item in enumerate(data__tolldescription_val__waysid):
+                                        if not isinstance(data__tolldescription_val__waysid_item, (str)):
+                                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id[{data__tolldescription_val__waysid_x}]".format(**locals()) + " must be string", value=data__tolldescription_val__waysid_item, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id[{data__tolldescription_val__waysid_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[0-9]+$'}, rule='type')
+                                        if isinstance(data__tolldescription_val__waysid_item, str):
+                                            if not REGEX_PATTERNS['^[0-9]+$'].search(data__tolldescription_val__waysid_item):
+                                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id[{data__tolldescription_val__waysid_x}]".format(**locals()) + " must match pattern ^[0-9]+$", value=data__tolldescription_val__waysid_item, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}.ways_id[{data__tolldescription_val__waysid_x}]".format(**locals()) + "", definition={'type': 'string', 'pattern': '^[0-9]+$'}, rule='pattern')
+                            if data__tolldescription_val_keys:
+                                raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + " must not contain "+str(data__tolldescription_val_keys)+" properties", value=data__tolldescription_val, name="" + (name_prefix or "data") + ".toll_description.{data__tolldescription_key}".format(**locals()) + "", definition={'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}, rule='additionalProperties')
+                if data__tolldescription_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".toll_description must not contain "+str(data__tolldescription_keys)+" properties", value=data__tolldescription, name="" + (name_prefix or "data") + ".toll_description", definition={'type': 'object', 'description': 'Detailed information about each toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+        if "open_toll_price" in data_keys:
+            data_keys.remove("open_toll_price")
+            data__opentollprice = data["open_toll_price"]
+            if not isinstance(data__opentollprice, (dict)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".open_toll_price must be object", value=data__opentollprice, name="" + (name_prefix or "data") + ".open_toll_price", definition={'type': 'object', 'description': 'Pricing for open (flat rate) tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+            data__opentollprice_is_dict = isinstance(data__opentollprice, dict)
+            if data__opentollprice_is_dict:
+                data__opentollprice_keys = set(data__opentollprice.keys())
+                for data__opentollprice_key, data__opentollprice_val in data__opentollprice.items():
+                    if REGEX_PATTERNS['^[A-Z0-9 _-]+$'].search(data__opentollprice_key):
+                        if data__opentollprice_key in data__opentollprice_keys:
+                            data__opentollprice_keys.remove(data__opentollprice_key)
+                        validate_https___example_com_toll_network_schema_json__definitions_edge(data__opentollprice_val, custom_formats, (name_prefix or "data") + ".open_toll_price.{data__opentollprice_key}".format(**locals()))
+                if data__opentollprice_keys:
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".open_toll_price must not contain "+str(data__opentollprice_keys)+" properties", value=data__opentollprice, name="" + (name_prefix or "data") + ".open_toll_price", definition={'type': 'object', 'description': 'Pricing for open (flat rate) tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'$schema': 'http://json-schema.org/draft-07/schema#', '$id': 'https://example.com/toll-network.schema.json', 'title': 'Toll Network Data', 'description': 'Schema for toll network pricing and topology data', 'type': 'object', 'required': ['date', 'version', 'name', 'list_of_operator', 'list_of_toll', 'currency', 'networks', 'toll_description', 'open_toll_price'], 'properties': {'date': {'type': 'string', 'pattern': '^\\d{2}/\\d{2}/\\d{4}$', 'description': 'Date in DD/MM/YYYY format'}, 'version': {'type': 'string', 'description': 'Version of the data format'}, 'name': {'type': 'string', 'description': 'Name of the pricing format'}, 'list_of_operator': {'type': 'array', 'description': 'List of toll operators', 'items': {'type': 'string'}, 'uniqueItems': True}, 'list_of_toll': {'type': 'array', 'description': 'List of all toll names', 'items': {'type': 'string', 'pattern': '^[A-Z0-9 _-]+$', 'description': 'Toll name: uppercase ASCII letters, digits, spaces, underscores, and hyphens'}, 'uniqueItems': True}, 'currency': {'type': 'string', 'pattern': '^[A-Z]{3}$', 'description': 'ISO 4217 currency code (e.g., EUR, USD)'}, 'networks': {'type': 'array', 'description': 'Connected components of closed toll networks', 'items': {'type': 'object', 'required': ['network_name', 'tolls', 'connection'], 'properties': {'network_name': {'type': 'string', 'description': 'Network identifier'}, 'tolls': {'type': 'array', 'description': 'List of toll names in this network', 'items': {'type': 'string'}, 'uniqueItems': True, 'minItems': 1}, 'connection': {'type': 'object', 'description': 'Directional connections between tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'description': 'Connections from a specific toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'toll_description': {'type': 'object', 'description': 'Detailed information about each toll', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['type'], 'properties': {'operator_ref': {'type': 'string', 'description': 'Operator reference code'}, 'lat': {'type': 'string', 'description': 'Latitude coordinate'}, 'lon': {'type': 'string', 'description': 'Longitude coordinate'}, 'operator': {'type': 'string', 'description': 'Operator name from OSM'}, 'type': {'type': 'string', 'enum': ['open', 'close'], 'description': 'Toll type: open (flat rate) or close (distance-based)'}, 'node_id': {'type': 'array', 'description': 'OSM node IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}, 'ways_id': {'type': 'array', 'description': 'OSM way IDs for toll booths (at least one of node_id or ways_id required)', 'items': {'type': 'string', 'pattern': '^[0-9]+$'}}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'open_toll_price': {'type': 'object', 'description': 'Pricing for open (flat rate) tolls', 'patternProperties': {'^[A-Z0-9 _-]+$': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'$ref': 'https://example.com/toll-network.schema.json#/definitions/priceClasses'}}, 'additionalProperties': False}}, 'additionalProperties': False}}, 'additionalProperties': False, 'definitions': {'edge': {'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, 'priceClasses': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_toll_network_schema_json__definitions_edge(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['price']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "distance" in data_keys:
+            data_keys.remove("distance")
+            data__distance = data["distance"]
+            if not isinstance(data__distance, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".distance must be string", value=data__distance, name="" + (name_prefix or "data") + ".distance", definition={'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, rule='type')
+            if isinstance(data__distance, str):
+                if not REGEX_PATTERNS['^(\\d+(\\.\\d+)?)?$'].search(data__distance):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".distance must match pattern ^(\\d+(\\.\\d+)?)?$", value=data__distance, name="" + (name_prefix or "data") + ".distance", definition={'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, rule='pattern')
+        if "price" in data_keys:
+            data_keys.remove("price")
+            data__price = data["price"]
+            validate_https___example_com_toll_network_schema_json__definitions_priceclasses(data__price, custom_formats, (name_prefix or "data") + ".price")
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'required': ['price'], 'properties': {'distance': {'type': 'string', 'pattern': '^(\\d+(\\.\\d+)?)?$', 'description': 'Distance in kilometers (optional, can be empty string)'}, 'price': {'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}}, 'additionalProperties': False}, rule='additionalProperties')
+    return data
+
+def validate_https___example_com_toll_network_schema_json__definitions_priceclasses(data, custom_formats={}, name_prefix=None):
+    if not isinstance(data, (dict)):
+        raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}, rule='type')
+    data_is_dict = isinstance(data, dict)
+    if data_is_dict:
+        data__missing_keys = set(['class_1', 'class_2', 'class_3', 'class_4', 'class_5']) - data.keys()
+        if data__missing_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}, rule='required')
+        data_keys = set(data.keys())
+        if "class_1" in data_keys:
+            data_keys.remove("class_1")
+            data__class1 = data["class_1"]
+            if not isinstance(data__class1, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_1 must be string", value=data__class1, name="" + (name_prefix or "data") + ".class_1", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, rule='type')
+            if isinstance(data__class1, str):
+                if not REGEX_PATTERNS['^\\d+(\\.\\d+)?$'].search(data__class1):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_1 must match pattern ^\\d+(\\.\\d+)?$", value=data__class1, name="" + (name_prefix or "data") + ".class_1", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, rule='pattern')
+        if "class_2" in data_keys:
+            data_keys.remove("class_2")
+            data__class2 = data["class_2"]
+            if not isinstance(data__class2, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_2 must be string", value=data__class2, name="" + (name_prefix or "data") + ".class_2", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, rule='type')
+            if isinstance(data__class2, str):
+                if not REGEX_PATTERNS['^\\d+(\\.\\d+)?$'].search(data__class2):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_2 must match pattern ^\\d+(\\.\\d+)?$", value=data__class2, name="" + (name_prefix or "data") + ".class_2", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, rule='pattern')
+        if "class_3" in data_keys:
+            data_keys.remove("class_3")
+            data__class3 = data["class_3"]
+            if not isinstance(data__class3, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_3 must be string", value=data__class3, name="" + (name_prefix or "data") + ".class_3", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, rule='type')
+            if isinstance(data__class3, str):
+                if not REGEX_PATTERNS['^\\d+(\\.\\d+)?$'].search(data__class3):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_3 must match pattern ^\\d+(\\.\\d+)?$", value=data__class3, name="" + (name_prefix or "data") + ".class_3", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, rule='pattern')
+        if "class_4" in data_keys:
+            data_keys.remove("class_4")
+            data__class4 = data["class_4"]
+            if not isinstance(data__class4, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_4 must be string", value=data__class4, name="" + (name_prefix or "data") + ".class_4", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, rule='type')
+            if isinstance(data__class4, str):
+                if not REGEX_PATTERNS['^\\d+(\\.\\d+)?$'].search(data__class4):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_4 must match pattern ^\\d+(\\.\\d+)?$", value=data__class4, name="" + (name_prefix or "data") + ".class_4", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, rule='pattern')
+        if "class_5" in data_keys:
+            data_keys.remove("class_5")
+            data__class5 = data["class_5"]
+            if not isinstance(data__class5, (str)):
+                raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_5 must be string", value=data__class5, name="" + (name_prefix or "data") + ".class_5", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}, rule='type')
+            if isinstance(data__class5, str):
+                if not REGEX_PATTERNS['^\\d+(\\.\\d+)?$'].search(data__class5):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".class_5 must match pattern ^\\d+(\\.\\d+)?$", value=data__class5, name="" + (name_prefix or "data") + ".class_5", definition={'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}, rule='pattern')
+        if data_keys:
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must not contain "+str(data_keys)+" properties", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'description': 'Prices for different vehicle classes (all required)', 'required': ['class_1', 'class_2', 'class_3', 'class_4', 'class_5'], 'properties': {'class_1': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 1 (light vehicles) - required'}, 'class_2': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 2 - required'}, 'class_3': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 3 - required'}, 'class_4': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 4 - required'}, 'class_5': {'type': 'string', 'pattern': '^\\d+(\\.\\d+)?$', 'description': 'Price for vehicle class 5 (heavy vehicles) - required'}}, 'additionalProperties': False}, rule='additionalProperties')
+    return data
+
+validate = validate_https___example_com_toll_network_schema_json
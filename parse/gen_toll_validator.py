@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# Copyright (c) 2025-2026 Louis TRIOULEYRE-ROBERJOT
+# This file is part of TollData - Open French Highway Toll Database
+"""
+Generate _toll_validator.py from toll_network_schema.json with fastjsonschema.
+
+The generated module is committed so validate_toll_json.py can skip schema
+compilation entirely. Re-run this script after every schema change (a stale
+module is detected by its schema hash and ignored).
+
+Usage:
+    python gen_toll_validator.py
+"""
+
+import sys
+from pathlib import Path
+
+from validate_toll_json import _sha256_file, fastjsonschema, generate_validator_code
+
+SCRIPT_DIR = Path(__file__).parent
+SCHEMA_PATH = SCRIPT_DIR / "toll_network_schema.json"
+OUTPUT_PATH = SCRIPT_DIR / "_toll_validator.py"
+
+HEADER = '''# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# This file is part of TollData - Open French Highway Toll Database
+# Fichier généré par gen_toll_validator.py depuis toll_network_schema.json
+# NE PAS MODIFIER À LA MAIN.
+# flake8: noqa
+
+SCHEMA_SHA256 = "{sha}"
+
+'''
+
+
+def main():
+    if fastjsonschema is None:
+        print("❌ Le module 'fastjsonschema' n'est pas installé.", file=sys.stderr)
+        print("   Installez-le avec: pip install fastjsonschema", file=sys.stderr)
+        sys.exit(1)
+
+    code = generate_validator_code(SCHEMA_PATH)
+    OUTPUT_PATH.write_text(
+        HEADER.format(sha=_sha256_file(SCHEMA_PATH)) + code, encoding="utf-8"
+    )
+    print(f"✅ Validateur généré: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -89,9 +89,13 @@ import datetime as dt
 import json
 import math
 import os
+import re
 import sys
 from collections import defaultdict, deque
 
+_INT_RE = re.compile(r"-?\d+")
+_INT_LIST_RE = re.compile(r"\[?\s*(-?\d+(?:\s*,\s*-?\d+)*)?\s*\]?")
+
 
 def _strip(s):
     return s.strip() if isinstance(s, str) else s
@@ -102,6 +106,10 @@ def _as_list_from_brackets(s):
     s = _strip(s)
     if not s:
         return []
+    # Fast path: the whole cell is a (possibly bracketed) list of integers
+    m = _INT_LIST_RE.fullmatch(s)
+    if m:
+        return _INT_RE.findall(m.group(1)) if m.group(1) else []
     try:
         val = ast.literal_eval(s)
         if isinstance(val, (list, tuple)):
@@ -148,18 +156,22 @@ def _to_str_number(value):
 def read_toll_info(path):
     info = {}
     operators = set()
+    # Operator and type values repeat across rows: share one string object per value
+    interned = {}
     with open(path, "r", encoding="utf-8") as f:
         reader = csv.DictReader(f, delimiter=";")
         for row in reader:
             name = _strip(row.get("name"))
             if not name:
                 continue
+            op = _strip(row.get("operator_osm"))
+            typ = _strip(row.get("type"))
             rec = {
                 "operator_ref": _strip(row.get("operator_ref")),
                 "lat": _strip(row.get("lat")),
                 "lon": _strip(row.get("lon")),
-                "operator": _strip(row.get("operator_osm")),
-                "type": _strip(row.get("type")),
+                "operator": interned.setdefault(op, op) if op else "",
+                "type": interned.setdefault(typ, typ) if typ else "",
                 "node_id": _as_list_from_brackets(row.get("booth_node_id")),
                 "ways_id": _as_list_from_brackets(row.get("booth_way_id")),
             }
@@ -18,6 +18,7 @@ Fonctionnalités:
 
 import csv
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Tuple
 
@@ -125,11 +126,12 @@ def remove_duplicates(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
     unique_rows = []
 
     for row in rows:
-        # Convertir le dictionnaire en tuple trié pour pouvoir le hacher
-        row_tuple = tuple(sorted(row.items()))
+        # Les lignes d'un même fichier partagent l'ordre des colonnes:
+        # les valeurs seules suffisent à identifier un doublon
+        key = tuple(row.values())
 
-        if row_tuple not in seen:
-            seen.add(row_tuple)
+        if key not in seen:
+            seen.add(key)
             unique_rows.append(row)
 
     return unique_rows
@@ -161,11 +163,12 @@ def merge_csv_files(input_files: List[str], output_file: str, csv_type: str) ->
     all_headers = None
     all_rows = []
 
-    # Lire tous les fichiers
-    for file_path in input_files:
-        print(f"  📄 Lecture: {Path(file_path).name}")
+    # Lire tous les fichiers en parallèle (l'ordre des entrées est conservé)
+    with ThreadPoolExecutor(max_workers=min(8, len(input_files))) as executor:
+        results = list(executor.map(read_csv_file, input_files))
 
-        headers, rows = read_csv_file(file_path)
+    for file_path, (headers, rows) in zip(input_files, results):
+        print(f"  📄 Lecture: {Path(file_path).name}")
 
         # Vérifier la cohérence des en-têtes
         if all_headers is None:
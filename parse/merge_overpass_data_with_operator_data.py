@@ -7,24 +7,24 @@ import re
 from difflib import SequenceMatcher
 from argparse import ArgumentParser
 
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
 def normalize_name(s: str) -> str:
     if not s:
         return ""
-    # Normalisation Unicode
-    s = unicodedata.normalize("NFKC", s)
-    # Retire les diacritiques (accents)
-    s = "".join(
-        c for c in unicodedata.normalize("NFD", s)
-        if unicodedata.category(c) != "Mn"
-    )
-    # Remplace tout ce qui n'est PAS lettre ou chiffre par un espace
-    s = re.sub(r"[^A-Za-z0-9]", " ", s)
-    # Remplace plusieurs espaces par un seul
-    s = re.sub(r"\s+", " ", s)
-    # Trim
-    s = s.strip()
-    # Uppercase
-    return s.upper()
+    # Chemin rapide : un nom ASCII n'a ni accent ni forme de compatibilité Unicode
+    if not s.isascii():
+        # Normalisation Unicode
+        s = unicodedata.normalize("NFKC", s)
+        # Retire les diacritiques (accents)
+        s = "".join(
+            c for c in unicodedata.normalize("NFD", s)
+            if unicodedata.category(c) != "Mn"
+        )
+    # Remplace toute suite de caractères non alphanumériques par un seul espace
+    s = _NON_ALNUM_RE.sub(" ", s)
+    # Trim + Uppercase
+    return s.strip().upper()
 
 def similarity(a, b):
     """Calcule la similarité entre deux chaînes"""
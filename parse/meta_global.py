@@ -13,145 +13,260 @@ Utilisation:
 """
 
 import csv
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Set, Dict, List
 
+# Tampon de lecture/écriture (1 Mo) pour limiter les appels système
+IO_BUFFER_SIZE = 1 << 20
 
-def detect_delimiter(file_path: str) -> str:
-    """
-    Détecte automatiquement le délimiteur d'un fichier CSV.
+# Colonnes de dédoublonnage obligatoires, par type de fichier
+KEY_COLUMNS = {
+    "close": ("name_from", "name_to"),
+    "open": ("name",),
+    "toll_info": ("name",),
+}
 
-    Args:
-        file_path: Chemin du fichier CSV
 
-    Returns:
-        Le délimiteur détecté (';' ou ',')
-    """
-    with open(file_path, "r", encoding="utf-8") as f:
-        first_line = f.readline()
-        if ";" in first_line:
-            return ";"
-        elif "," in first_line:
-            return ","
-        else:
-            return ";"
+class GlobalMergeError(Exception):
+    """Exception levée lorsqu'un fichier d'entrée ne peut pas être fusionné."""
 
+    pass
 
-def merge_csv_files(input_files: List[str], output_file: str, file_type: str) -> int:
+
+def _detect_delimiter(f) -> str:
     """
-    Fusionne plusieurs fichiers CSV en un seul.
+    Détecte le délimiteur (';' ou ',') d'un fichier CSV déjà ouvert.
+
+    Inspecte la première ligne directement dans le tampon binaire, sans
+    consommer de données ni rouvrir le fichier.
 
     Args:
-        input_files: Liste des chemins des fichiers à fusionner
-        output_file: Chemin du fichier de sortie
-        file_type: Type de fichier ('close', 'open', ou 'toll_info')
+        f: Fichier texte ouvert en lecture, pas encore lu
 
     Returns:
-        Nombre de lignes écrites (hors header)
+        Le délimiteur détecté (';' ou ',')
     """
-    print(f"\n📋 Fusion de {len(input_files)} fichier(s) de type '{file_type}'...")
+    first_line = f.buffer.peek(8192).split(b"\n", 1)[0]
+    if first_line.find(b";") != -1:
+        return ";"
+    elif first_line.find(b",") != -1:
+        return ","
+    else:
+        return ";"
 
-    all_rows = []
-    header = None
 
-    # Lecture de tous les fichiers
-    for file_path in input_files:
-        if not Path(file_path).exists():
-            print(f"  ⚠️  Fichier non trouvé: {file_path}")
-            continue
+def _index_or_none(header, column: str):
+    """Position d'une colonne dans l'en-tête, ou None si elle est absente."""
+    return header.index(column) if column in header else None
 
-        delimiter = detect_delimiter(file_path)
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
+def _has_quote(f) -> bool:
+    """
+    Indique si un fichier ouvert contient un guillemet, n'importe où.
 
-            # Récupérer le header du premier fichier
-            if header is None:
-                header = reader.fieldnames
+    Le fichier est parcouru via mmap (recherche en C, sans copie ni lecture
+    du flux texte) : la position de lecture de f n'est pas modifiée.
+    """
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m.find(b'"') != -1
+    except ValueError:  # fichier vide: mmap de taille nulle impossible
+        return False
 
-            # Vérifier la cohérence des headers
-            if reader.fieldnames != header:
-                print(f"  ⚠️  Attention: Headers différents dans {Path(file_path).name}")
 
-            # Lire toutes les lignes
-            rows_read = 0
-            for row in reader:
-                all_rows.append(row)
-                rows_read += 1
+def _row_reader(f, delimiter: str):
+    """
+    Retourne un itérateur de lignes (listes de champs) sur un fichier CSV ouvert.
 
-            print(f"  📄 Lecture: {Path(file_path).name}")
-            print(f"    → {rows_read} ligne(s) lues")
+    Les fichiers ';' de ce projet (noms, coordonnées, prix) ne contiennent pas
+    de champs entre guillemets : dans ce cas un simple split suffit et évite le
+    parseur CSV général. Si un guillemet apparaît n'importe où dans le fichier,
+    on revient à csv.reader.
 
-    if not all_rows:
-        print("  ⚠️  Aucune donnée à écrire")
-        return 0
+    Args:
+        f: Fichier texte ouvert en lecture (newline=""), pas encore lu
+        delimiter: Délimiteur détecté
 
-    print(f"\n  Total avant dédoublonnage: {len(all_rows)} ligne(s)")
+    Returns:
+        Itérateur de listes de chaînes, en-tête compris
+    """
+    if delimiter == ";" and not _has_quote(f):
+        return (line.rstrip("\r\n").split(";") for line in f)
+    return csv.reader(f, delimiter=delimiter)
 
-    # Dédoublonnage
-    if file_type in ["close", "open"]:
-        # Pour les fichiers de prix, on dédoublonne sur name_from/name_to ou name
-        seen = set()
-        unique_rows = []
 
-        for row in all_rows:
-            if file_type == "close":
-                key = (row.get("name_from", ""), row.get("name_to", ""))
-            else:  # open
-                key = row.get("name", "")
+def merge_csv_files(input_files: List[str], output_file: str, file_type: str) -> int:
+    """
+    Fusionne plusieurs fichiers CSV en un seul.
 
-            if key not in seen:
-                seen.add(key)
-                unique_rows.append(row)
+    Les lignes sont écrites au fil de la lecture : seules les clés de
+    dédoublonnage restent en mémoire, pas l'ensemble des lignes.
 
-        all_rows = unique_rows
+    Args:
+        input_files: Liste des chemins des fichiers à fusionner
+        output_file: Chemin du fichier de sortie
+        file_type: Type de fichier ('close', 'open', ou 'toll_info')
 
-    elif file_type == "toll_info":
-        # Pour toll_info, on dédoublonne sur name et on vérifie la cohérence des OSM IDs
-        name_to_row = {}
+    Returns:
+        Nombre de lignes écrites (hors header)
+    """
+    print(f"\n📋 Fusion de {len(input_files)} fichier(s) de type '{file_type}'...")
 
-        for row in all_rows:
-            name = row.get("name", "").strip()
-            if not name:
+    header = None
+    out = None
+    tmp_file = Path(output_file).with_name(Path(output_file).name + ".tmp")
+    writer = None
+    total_read = 0
+    written = 0
+
+    # Pour close/open: clés déjà vues; pour toll_info: name -> (booth_node_id, booth_way_id)
+    seen = set()
+    name_to_osm_ids: Dict[str, tuple] = {}
+
+    try:
+        for file_path in input_files:
+            path = Path(file_path)
+            file_name = path.name
+            if not path.exists():
+                print(f"  ⚠️  Fichier non trouvé: {file_path}")
                 continue
 
-            if name in name_to_row:
-                # Vérifier la cohérence des IDs OSM
-                existing = name_to_row[name]
-                booth_node_id = row.get("booth_node_id", "")
-                booth_way_id = row.get("booth_way_id", "")
-                existing_node_id = existing.get("booth_node_id", "")
-                existing_way_id = existing.get("booth_way_id", "")
-
-                if booth_node_id and booth_node_id != existing_node_id:
-                    print(
-                        f"  ⚠️  Conflit OSM node_id pour '{name}': {existing_node_id} vs {booth_node_id}"
-                    )
-
-                if booth_way_id and booth_way_id != existing_way_id:
-                    print(
-                        f"  ⚠️  Conflit OSM way_id pour '{name}': {existing_way_id} vs {booth_way_id}"
-                    )
-            else:
-                name_to_row[name] = row
-
-        all_rows = list(name_to_row.values())
-
-    print(f"  Total après dédoublonnage: {len(all_rows)} ligne(s)")
-
-    # Écriture du fichier de sortie
-    print(f"\n  💾 Écriture du fichier: {Path(output_file).name}")
-
-    with open(output_file, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=header, delimiter=";")
-        writer.writeheader()
-        writer.writerows(all_rows)
+            with open(
+                path, "r", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE
+            ) as f:
+                reader = _row_reader(f, _detect_delimiter(f))
+                # En-tête figé en tuple : comparaison directe, une fois par fichier
+                # (lignes vides ignorées avant l'en-tête, comme csv.DictReader)
+                file_header = next(
+                    (tuple(row) for row in reader if row and row != [""]), None
+                )
+                if file_header is None:
+                    print(f"  ⚠️  Fichier sans en-tête, ignoré: {file_name}")
+                    continue
+
+                # Le header du premier fichier définit l'ordre des colonnes en sortie
+                if header is None:
+                    key_columns = KEY_COLUMNS.get(file_type, ())
+                    missing = [c for c in key_columns if c not in file_header]
+                    if missing:
+                        raise GlobalMergeError(
+                            f"Colonne(s) de dédoublonnage manquante(s) dans "
+                            f"{file_name}: {', '.join(missing)}"
+                        )
+                    header = file_header
+                    n_cols = len(header)
+
+                    if file_type == "toll_info":
+                        key_idx = []
+                        name_idx = header.index("name")
+                        # IDs OSM facultatifs: colonne absente -> valeur vide
+                        node_idx = _index_or_none(header, "booth_node_id")
+                        way_idx = _index_or_none(header, "booth_way_id")
+                    else:
+                        key_idx = [header.index(c) for c in key_columns]
+
+                # Vérifier la cohérence des headers
+                if file_header != header:
+                    print(f"  ⚠️  Attention: Headers différents dans {file_name}")
+                    # Réaligner les colonnes de ce fichier sur le header de sortie
+                    positions = [
+                        file_header.index(c) if c in file_header else None
+                        for c in header
+                    ]
+                else:
+                    positions = None
+
+                rows_read = 0
+                for row in reader:
+                    # Lignes vides ignorées (comme csv.DictReader)
+                    if not row or row == [""]:
+                        continue
+                    rows_read += 1
+                    if out is None:
+                        # Sortie ouverte à la première ligne de données seulement,
+                        # dans un fichier temporaire: sans données ou en cas
+                        # d'erreur, le fichier existant reste intact
+                        out = open(
+                            tmp_file,
+                            "w",
+                            encoding="utf-8",
+                            newline="",
+                            buffering=IO_BUFFER_SIZE,
+                        )
+                        writer = csv.writer(out, delimiter=";")
+                        writer.writerow(header)
+                    if positions is not None:
+                        row = [
+                            row[i] if i is not None and i < len(row) else ""
+                            for i in positions
+                        ]
+                    elif len(row) < n_cols:
+                        row = row + [""] * (n_cols - len(row))
+
+                    if file_type == "toll_info":
+                        # On dédoublonne sur name et on vérifie la cohérence des OSM IDs
+                        name = row[name_idx].strip()
+                        if not name:
+                            continue
+
+                        booth_node_id = row[node_idx] if node_idx is not None else ""
+                        booth_way_id = row[way_idx] if way_idx is not None else ""
+                        if name in name_to_osm_ids:
+                            existing_node_id, existing_way_id = name_to_osm_ids[name]
+
+                            if booth_node_id and booth_node_id != existing_node_id:
+                                print(
+                                    f"  ⚠️  Conflit OSM node_id pour '{name}': {existing_node_id} vs {booth_node_id}"
+                                )
+
+                            if booth_way_id and booth_way_id != existing_way_id:
+                                print(
+                                    f"  ⚠️  Conflit OSM way_id pour '{name}': {existing_way_id} vs {booth_way_id}"
+                                )
+                            continue
+
+                        name_to_osm_ids[name] = (booth_node_id, booth_way_id)
+
+                    elif key_idx:
+                        # Pour les fichiers de prix, on dédoublonne sur name_from/name_to ou name
+                        # Une seule chaîne par clé (plutôt qu'un tuple de chaînes):
+                        # la mémoire retenue par `seen` se limite à un objet par clé
+                        key = "\x1f".join([row[i] for i in key_idx])
+                        if key in seen:
+                            continue
+                        seen.add(key)
+
+                    writer.writerow(row)
+                    written += 1
+
+                total_read += rows_read
+                print(f"  📄 Lecture: {file_name}")
+                print(f"    → {rows_read} ligne(s) lues")
+    except BaseException:
+        if out is not None:
+            out.close()
+            tmp_file.unlink(missing_ok=True)
+        raise
+
+    if out is not None:
+        out.close()
+        # Remplacement atomique, seulement une fois toutes les entrées lues
+        os.replace(tmp_file, output_file)
+
+    if not total_read:
+        print("  ⚠️  Aucune donnée à écrire")
+        return 0
 
-    print(f"    ✅ {len(all_rows)} ligne(s) écrite(s)")
+    print(f"\n  Total avant dédoublonnage: {total_read} ligne(s)")
+    print(f"  Total après dédoublonnage: {written} ligne(s)")
+    print(f"\n  💾 Fichier écrit: {Path(output_file).name}")
+    print(f"    ✅ {written} ligne(s) écrite(s)")
     print(f"\n✅ Fusion terminée avec succès: {output_file}\n")
 
-    return len(all_rows)
+    return written
 
 
 def main():
@@ -184,10 +299,11 @@ def main():
         area_open,
         area_toll_info,
     ]:
+        label = file_path.relative_to(base_dir)
         if file_path.exists():
-            print(f"  ✅ {file_path.relative_to(base_dir)}")
+            print(f"  ✅ {label}")
         else:
-            print(f"  ❌ MANQUANT: {file_path.relative_to(base_dir)}")
+            print(f"  ❌ MANQUANT: {label}")
             all_files_exist = False
 
     if not all_files_exist:
@@ -199,29 +315,35 @@ def main():
     output_open = base_dir / "GLOBAL_data_price_open.csv"
     output_toll_info = base_dir / "GLOBAL_toll_info.csv"
 
-    print("\n" + "=" * 80)
-    print("  ÉTAPE 1/3: Fusion des fichiers Close")
-    print("=" * 80)
-
-    close_count = merge_csv_files(
-        [str(asf_close), str(area_close)], str(output_close), "close"
-    )
-
-    print("=" * 80)
-    print("  ÉTAPE 2/3: Fusion des fichiers Open")
-    print("=" * 80)
-
-    open_count = merge_csv_files(
-        [str(asf_open), str(area_open)], str(output_open), "open"
-    )
-
-    print("=" * 80)
-    print("  ÉTAPE 3/3: Fusion des fichiers Toll Info")
-    print("=" * 80)
-
-    toll_info_count = merge_csv_files(
-        [str(asf_toll_info), str(area_toll_info)], str(output_toll_info), "toll_info"
-    )
+    try:
+        print("\n" + "=" * 80)
+        print("  ÉTAPE 1/3: Fusion des fichiers Close")
+        print("=" * 80)
+
+        close_count = merge_csv_files(
+            [str(asf_close), str(area_close)], str(output_close), "close"
+        )
+
+        print("=" * 80)
+        print("  ÉTAPE 2/3: Fusion des fichiers Open")
+        print("=" * 80)
+
+        open_count = merge_csv_files(
+            [str(asf_open), str(area_open)], str(output_open), "open"
+        )
+
+        print("=" * 80)
+        print("  ÉTAPE 3/3: Fusion des fichiers Toll Info")
+        print("=" * 80)
+
+        toll_info_count = merge_csv_files(
+            [str(asf_toll_info), str(area_toll_info)],
+            str(output_toll_info),
+            "toll_info",
+        )
+    except GlobalMergeError as e:
+        print(f"\n❌ ERREUR: {e}")
+        sys.exit(1)
 
     # Résumé final
     print("=" * 80)
@@ -24,10 +24,20 @@ Usage :
 import argparse
 import csv
 import json
-from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 
-TOLL_KEYS = ("barrier", "highway", "amenity")
-TOLL_VALUES = {"toll_booth"}  # on tolère plusieurs clés possibles
+try:
+    import ijson
+except ImportError:  # optionnel: lecture en flux des gros exports
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optionnel: parsing JSON plus rapide
+    orjson = None
+
+TOLL_VALUE = "toll_booth"  # sous barrier=, highway= ou amenity=
 
 
 def extract_operator_ref(tags: dict) -> str:
@@ -44,15 +54,75 @@ def extract_operator_ref(tags: dict) -> str:
 def is_toll_booth_node(el: dict) -> bool:
     if el.get("type") != "node":
         return False
-    tags = el.get("tags") or {}
-    if not isinstance(tags, dict):
+    tags = el.get("tags")
+    if not tags or not isinstance(tags, dict):
         return False
     # La norme OSM est barrier=toll_booth ; on accepte aussi highway/amenity par tolérance
-    for k in TOLL_KEYS:
-        v = tags.get(k)
-        if v in TOLL_VALUES:
-            return True
-    return False
+    return (
+        tags.get("barrier") == TOLL_VALUE
+        or tags.get("highway") == TOLL_VALUE
+        or tags.get("amenity") == TOLL_VALUE
+    )
+
+
+def iter_elements(path: str):
+    """
+    Itère sur les éléments d'un export Overpass.
+
+    Avec ijson, le fichier est lu en flux : un seul élément en mémoire à la fois,
+    ce qui permet de traiter des exports de plusieurs centaines de Mo.
+    """
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "elements.item", use_float=True)
+        return
+
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    yield from data.get("elements", [])
+
+
+# Une cabine = (id, name, lat, lon, operator_ref)
+_BOOTH_NAME = itemgetter(1)
+
+
+def iter_rows(booths: list):
+    """Génère une ligne CSV (dans l'ordre des colonnes) par nom de péage.
+
+    `booths` doit être trié par nom : les cabines d'un même péage sont contiguës.
+    """
+    for name, group in groupby(booths, key=_BOOTH_NAME):
+        items = list(group)
+        lats = []
+        lons = []
+        for _, _, lat, lon, _ in items:
+            if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
+                lats.append(lat)
+                lons.append(lon)
+        if lats:
+            # sum() sur une liste de floats reste dans la boucle C de CPython
+            lat = sum(lats) / len(lats)
+            lon = sum(lons) / len(lons)
+        else:
+            lat = lon = float("nan")
+        n = len(items)
+        ids = [i[0] for i in items if i[0] is not None]
+        # Choisir un operator_ref : si tous identiques, garder la valeur commune, sinon vide
+        op_values = {i[4] for i in items if i[4]}
+        operator_ref = list(op_values)[0] if len(op_values) == 1 else ""
+
+        yield [
+            name,
+            operator_ref,
+            f"{lat:.7f}" if isinstance(lat, float) else "",
+            f"{lon:.7f}" if isinstance(lon, float) else "",
+            n,
+            json.dumps(ids, ensure_ascii=False),
+        ]
 
 
 def main():
@@ -70,62 +140,25 @@ def main():
     )
     args = parser.parse_args()
 
-    with open(args.input_json, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    elements = data.get("elements", [])
     # Filtrer uniquement les nodes représentant des cabines de péage
     booths = []
-    for el in elements:
+    for el in iter_elements(args.input_json):
         if not is_toll_booth_node(el):
             continue
         tags = el.get("tags") or {}
         name = tags.get("name") or "UNKNOWN"
         booths.append(
-            {
-                "id": el.get("id"),
-                "name": name,
-                "lat": el.get("lat"),
-                "lon": el.get("lon"),
-                "operator_ref": extract_operator_ref(tags),
-            }
+            (
+                el.get("id"),
+                name,
+                el.get("lat"),
+                el.get("lon"),
+                extract_operator_ref(tags),
+            )
         )
 
-    # Agrégation par nom
-    grouped = defaultdict(list)
-    for b in booths:
-        grouped[b["name"]].append(b)
-
-    # Construire les lignes de sortie
-    rows = []
-    for name, items in grouped.items():
-        coords = [
-            (i.get("lat"), i.get("lon"))
-            for i in items
-            if isinstance(i.get("lat"), (int, float))
-            and isinstance(i.get("lon"), (int, float))
-        ]
-        if coords:
-            lat = sum(lat for lat, _ in coords) / len(coords)
-            lon = sum(lon for _, lon in coords) / len(coords)
-        else:
-            lat = lon = float("nan")
-        n = len(items)
-        ids = [i["id"] for i in items if i.get("id") is not None]
-        # Choisir un operator_ref : si tous identiques, garder la valeur commune, sinon vide
-        op_values = {i["operator_ref"] for i in items if i.get("operator_ref")}
-        operator_ref = list(op_values)[0] if len(op_values) == 1 else ""
-
-        rows.append(
-            {
-                "osm_name": name,
-                "operator_ref": operator_ref,
-                "lat": f"{lat:.7f}" if isinstance(lat, float) else "",
-                "lon": f"{lon:.7f}" if isinstance(lon, float) else "",
-                "nbs_booth": n,
-                "booth_node_id": json.dumps(ids, ensure_ascii=False),
-            }
-        )
+    # Agrégation par nom : tri stable, les cabines gardent leur ordre d'origine
+    booths.sort(key=_BOOTH_NAME)
 
     # Écriture CSV
     fieldnames = [
@@ -136,21 +169,26 @@ def main():
         "nbs_booth",
         "booth_node_id",
     ]
-    with open(args.output_csv, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    with open(
+        args.output_csv, "w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        # Les lignes sont produites au fil de l'écriture, sans liste intermédiaire
+        n_rows = 0
+        for row in iter_rows(booths):
+            writer.writerow(row)
+            n_rows += 1
 
     # Messages d'aide si rien trouvé
-    if not rows:
+    if not n_rows:
         print("⚠️ Aucun node de péage trouvé dans ce JSON.")
         print(
             "Vérifie que tes cabines sont bien taguées barrier=toll_booth (ou highway/amenity=toll_booth)"
         )
         print("et que la requête Overpass inclut les tags (utilise `out body;`).")
 
-    print(f"✅ {len(rows)} ligne(s) écrite(s) dans {args.output_csv}")
+    print(f"✅ {n_rows} ligne(s) écrite(s) dans {args.output_csv}")
 
 
 if __name__ == "__main__":
@@ -1,14 +1,58 @@
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import csv
 
 pdf_path = Path("ASF_page7.pdf")
 out_text_path = Path("asf_page7.txt")
 
-# --- Texte avec PyPDF2 ---
-import PyPDF2
-reader = PyPDF2.PdfReader(str(pdf_path))
-with out_text_path.open("w", encoding="utf-8") as f:
-    for i, page in enumerate(reader.pages, start=1):
-        txt = page.extract_text() or ""
-        f.write(f"\n\n===== PAGE {i} / {len(reader.pages)} =====\n")
-        f.write(txt)
\ No newline at end of file
+# --- Texte avec pypdfium2 (PDFium, C++) si disponible, sinon PyPDF2 ---
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+    import PyPDF2
+
+
+# En dessous de ce nombre de pages, le démarrage des process coûte plus
+# que l'extraction elle-même
+PARALLEL_MIN_PAGES = 8
+
+
+def _open(pdf_path):
+    if pdfium is not None:
+        return pdfium.PdfDocument(pdf_path)
+    return PyPDF2.PdfReader(pdf_path)
+
+
+def _count_pages(doc):
+    if pdfium is not None:
+        return len(doc)
+    return len(doc.pages)
+
+
+def _page_text(doc, page_idx):
+    if pdfium is not None:
+        return doc[page_idx].get_textpage().get_text_range()
+    return doc.pages[page_idx].extract_text() or ""
+
+
+def _extract(page_idx, pdf_path):
+    # Chaque process ouvre son propre document (non partageable entre process)
+    return page_idx, _page_text(_open(pdf_path), page_idx)
+
+
+if __name__ == "__main__":
+    doc = _open(str(pdf_path))
+    n_pages = _count_pages(doc)
+    if n_pages >= PARALLEL_MIN_PAGES:
+        # Les pages sont indépendantes : extraction répartie sur tous les coeurs
+        with ProcessPoolExecutor() as ex:
+            results = sorted(ex.map(partial(_extract, pdf_path=str(pdf_path)), range(n_pages)))
+    else:
+        # Peu de pages : extraction directe sur le document déjà ouvert
+        results = [(page_idx, _page_text(doc, page_idx)) for page_idx in range(n_pages)]
+    with out_text_path.open("w", encoding="utf-8") as f:
+        for page_idx, txt in results:
+            f.write(f"\n\n===== PAGE {page_idx + 1} / {n_pages} =====\n")
+            f.write(txt)
@@ -1,30 +1,148 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # Copyright (c) 2025-2026 Louis TRIOULEYRE-ROBERJOT
 # This file is part of TollData - Open French Highway Toll Database
+import argparse
+import gzip
+import hashlib
 import json
 import time
+from pathlib import Path
 
 import requests
-
-
-def query_overpass(query: str, timeout: int = 180) -> dict:
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optionnel: parsing/écriture JSON plus rapides
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  (requis par httpx pour http2=True)
+except ImportError:  # optionnel: HTTP/2 (multiplexage, en-têtes compressés)
+    httpx = None
+
+# Réponses Overpass déjà téléchargées, indexées par hash de la requête
+CACHE_DIR = Path(__file__).parent / "overpass_cache"
+
+_HEADERS = {"Accept-Encoding": "gzip, deflate", "User-Agent": "TollData/1.0"}
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF = 1.5
+_RETRY_STATUS = (429, 502, 504)
+
+# Session partagée : connexion TCP/TLS réutilisée entre requêtes, réponses
+# compressées, et nouvelles tentatives avec backoff exponentiel quand Overpass
+# est surchargé (429) ou en timeout côté passerelle (502/504).
+_SESSION = requests.Session()
+_SESSION.headers.update(_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=list(_RETRY_STATUS),
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        )
+    ),
+)
+
+# Si httpx + h2 sont installés, les requêtes passent en HTTP/2 sur une seule
+# connexion multiplexée (utile quand plusieurs régions sont requêtées à la suite).
+if httpx is not None:
+    _HTTP2_CLIENT = httpx.Client(
+        http2=True,
+        headers=_HEADERS,
+        transport=httpx.HTTPTransport(http2=True, retries=_RETRY_TOTAL),
+    )
+    _HTTPX_ERRORS = (httpx.HTTPError,)
+else:
+    _HTTP2_CLIENT = None
+    _HTTPX_ERRORS = ()
+
+
+def _post_http2(url: str, data: dict, timeout: int):
+    """POST via le client HTTP/2, avec la même politique de retry que _SESSION."""
+    response = _HTTP2_CLIENT.post(url, data=data, timeout=timeout)
+    for attempt in range(_RETRY_TOTAL):
+        if response.status_code not in _RETRY_STATUS:
+            break
+        time.sleep(_RETRY_BACKOFF * 2**attempt)
+        response = _HTTP2_CLIENT.post(url, data=data, timeout=timeout)
+    return response
+
+
+def _cache_path(query: str) -> Path:
+    key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.json.gz"
+
+
+def _load_cached(path: Path) -> dict:
+    with gzip.open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _store_cached(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    raw = (
+        orjson.dumps(data)
+        if orjson is not None
+        else json.dumps(data, ensure_ascii=False).encode("utf-8")
+    )
+    # Écriture dans un fichier temporaire puis renommage: pas de cache tronqué
+    tmp = path.with_suffix(".tmp")
+    with gzip.open(tmp, "wb", compresslevel=3) as f:
+        f.write(raw)
+    tmp.replace(path)
+
+
+def query_overpass(query: str, timeout: int = 180, use_cache: bool = True) -> dict:
     """
     Effectue une requête Overpass et retourne la réponse JSON
 
     Args:
         query: La requête Overpass au format string
         timeout: Timeout en secondes pour la requête
+        use_cache: Réutiliser/enregistrer la réponse dans CACHE_DIR (les réponses
+            contenant une "remark" Overpass ne sont jamais enregistrées)
 
     Returns:
         dict: La réponse JSON parsée
     """
+    cache_path = _cache_path(query)
+    if use_cache and cache_path.exists():
+        print(f"Réponse lue depuis le cache: {cache_path}")
+        return _load_cached(cache_path)
+
+    data = _fetch_overpass(query, timeout)
+    if "remark" in data:
+        # Erreur d'exécution côté Overpass (ex: timeout): réponse HTTP 200 mais
+        # résultat partiel, à ne surtout pas rejouer depuis le cache
+        print(f"⚠️  Remarque Overpass (réponse non mise en cache): {data['remark']}")
+    elif use_cache:
+        _store_cached(cache_path, data)
+    return data
+
+
+def _fetch_overpass(query: str, timeout: int) -> dict:
+    """Envoie la requête au serveur Overpass et retourne la réponse JSON parsée."""
     overpass_url = "https://overpass-api.de/api/interpreter"
 
     try:
-        response = requests.post(overpass_url, data={"data": query}, timeout=timeout)
+        if _HTTP2_CLIENT is not None:
+            response = _post_http2(overpass_url, {"data": query}, timeout)
+        else:
+            response = _SESSION.post(
+                overpass_url, data={"data": query}, timeout=timeout
+            )
         response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, *_HTTPX_ERRORS) as e:
         raise Exception(f"Erreur lors de la requête Overpass: {e}")
     except json.JSONDecodeError as e:
         raise Exception(f"Erreur parsing Overpass JSON: {e}")
@@ -32,12 +150,26 @@ def query_overpass(query: str, timeout: int = 180) -> dict:
 
 def save_json(data: dict, output_file: str):
     """Sauvegarde les données au format JSON"""
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     print(f"Données sauvegardées dans: {output_file}")
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Exécuter une requête Overpass et sauvegarder la réponse JSON."
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignorer le cache ({CACHE_DIR.name}/) et refaire la requête",
+    )
+    args = parser.parse_args()
+
     # Requête Overpass
     query = """
     [out:json][timeout:900][maxsize:1073741824];
@@ -73,7 +205,7 @@ def main():
 
     try:
         # Effectuer la requête
-        response_data = query_overpass(query)
+        response_data = query_overpass(query, use_cache=not args.no_cache)
 
         # Sauvegarder la réponse
         output_file = "overpass_network_bretagne.json"
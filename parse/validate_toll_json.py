@@ -12,24 +12,74 @@ Usage:
 """
 
 import argparse
+import hashlib
+import heapq
+import importlib.util
 import json
+import os
+import re
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 try:
     import jsonschema
-    from jsonschema import SchemaError, ValidationError, validate
+    from jsonschema import SchemaError, ValidationError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:
     print("❌ Le module 'jsonschema' n'est pas installé.", file=sys.stderr)
     print("   Installez-le avec: pip install jsonschema", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import fastjsonschema
+except ImportError:  # optional: generated validator, much faster
+    fastjsonschema = None
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # optional: faster JSON parsing
+    _loads = json.loads
+
+if fastjsonschema is not None:
+    _FAST_SCHEMA_ERRORS = (fastjsonschema.JsonSchemaDefinitionException,)
+    _FAST_VALIDATION_ERRORS = (fastjsonschema.JsonSchemaValueException,)
+else:
+    _FAST_SCHEMA_ERRORS = _FAST_VALIDATION_ERRORS = ()
+
+# Formats checked by extra_validate (compiled once)
+_NAME_RE = re.compile(r"^[A-Z0-9 _-]+$")
+_PRICE_CLASSES = ("class_1", "class_2", "class_3", "class_4", "class_5")
+_PRICE_CLASS_SET = frozenset(_PRICE_CLASSES)
+_PRICE_GET = itemgetter(*_PRICE_CLASSES)  # the 5 prices in a single call
+
+# Validators already built, by schema path
+_VALIDATORS = {}
+
+# Generated fastjsonschema validators, kept between runs
+VALIDATOR_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "opentolldata"
+)
+# Digests of files already validated (--fast): {data sha256: schema+script sha256}
+VALIDATED_CACHE_FILE = VALIDATOR_CACHE_DIR / "validated.json"
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 def load_json(path):
     """Load and parse a JSON file."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _loads(f.read())
     except FileNotFoundError:
         print(f"❌ Fichier introuvable: {path}", file=sys.stderr)
         sys.exit(1)
@@ -39,31 +89,237 @@ def load_json(path):
         sys.exit(1)
 
 
+def _compile_jsonschema(schema):
+    """Build a jsonschema-based check function for an already-loaded schema."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+
+    def check(data):
+        # Same error as jsonschema.validate(): the most relevant one
+        error = best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
+
+    return check
+
+
+def generate_validator_code(schema_path):
+    """Generate the fastjsonschema validator source, exposing it as ``validate``."""
+    code = fastjsonschema.compile_to_code(load_json(schema_path))
+    # The root function (named after the schema $id) is the first one
+    # defined: expose it under a fixed name
+    root = re.search(r"^def (\w+)\(", code, re.MULTILINE).group(1)
+    return code + f"\n\nvalidate = {root}\n"
+
+
+def _load_prebuilt_validator(schema_path):
+    """
+    Return the validator committed in _toll_validator.py, or None.
+
+    It is only used if it was generated from this exact schema (same SHA-256);
+    regenerate it with gen_toll_validator.py after editing the schema.
+    """
+    try:
+        import _toll_validator
+    except ImportError:  # module missing or fastjsonschema not installed
+        return None
+    if not Path(schema_path).is_file():
+        return None
+    if _toll_validator.SCHEMA_SHA256 != _sha256_file(schema_path):
+        return None
+    return _toll_validator.validate
+
+
+def _load_fast_validator(schema_path):
+    """
+    Return the fastjsonschema validator for a schema file, using an on-disk cache.
+
+    The generated module is keyed by the schema file path, mtime and size (and
+    the fastjsonschema version), so an unchanged schema skips both the JSON
+    parse and the code generation on later runs.
+    """
+    path = Path(schema_path).resolve()
+    if not path.is_file():
+        load_json(schema_path)  # usual error message + exit
+    st = path.stat()
+    key = hashlib.sha1(
+        f"{path}:{st.st_mtime_ns}:{st.st_size}:{fastjsonschema.VERSION}".encode()
+    ).hexdigest()
+    module_path = VALIDATOR_CACHE_DIR / f"validator_{key}.py"
+
+    if not module_path.exists():
+        code = generate_validator_code(schema_path)
+        try:
+            VALIDATOR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = module_path.with_suffix(".tmp")
+            tmp.write_text(code, encoding="utf-8")
+            tmp.replace(module_path)
+        except OSError:
+            # Cache not writable: use the generated code without keeping it
+            namespace = {}
+            exec(code, namespace)
+            return namespace["validate"]
+
+    spec = importlib.util.spec_from_file_location(f"_toll_validator_{key}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def get_validator(schema_path):
+    """
+    Load the schema once and return a reusable check function.
+
+    Uses the fastjsonschema generated validator when available,
+    jsonschema otherwise. The check function raises on the first error.
+    """
+    key = str(Path(schema_path).resolve())
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        if fastjsonschema is not None:
+            validator = _load_prebuilt_validator(schema_path) or _load_fast_validator(
+                schema_path
+            )
+        else:
+            validator = _compile_jsonschema(load_json(schema_path))
+        _VALIDATORS[key] = validator
+    return validator
+
+
+def _is_price(value):
+    """True for a numeric price string such as "12" or "12.50"."""
+    if not isinstance(value, str):
+        return False
+    integer, dot, decimals = value.partition(".")
+    return integer.isdecimal() and (not dot or decimals.isdecimal())
+
+
+def _are_digit_strings(ids):
+    """True if every item of ids is a string of digits (OSM IDs)."""
+    try:
+        return all(map(str.isdigit, ids))
+    except TypeError:  # item that is not a string
+        return False
+
+
+def _price_errors(edge):
+    """
+    Check the price object of an open toll or of a connection.
+
+    Returns the error messages without their location prefix (to be appended
+    to the entry path), empty if the price is valid or edge is not an object.
+    """
+    try:
+        price = edge["price"]
+    except KeyError:
+        return [": price is required"]
+    except TypeError:  # edge is not an object: reported by the schema
+        return ()
+    if not price or not isinstance(price, dict):
+        return [": price is required"]
+
+    try:
+        values = _PRICE_GET(price)
+        missing = ()
+    except KeyError:  # missing class: check class by class
+        values = [price.get(cls) for cls in _PRICE_CLASSES]
+        missing = _PRICE_CLASS_SET - price.keys()
+    errors = []
+    for cls, value in zip(_PRICE_CLASSES, values):
+        if cls in missing:
+            errors.append(f".price: missing {cls}")
+        elif not _is_price(value):
+            errors.append(f".price.{cls}: must be a numeric string")
+    return errors
+
+
 def _fmt_set(values, max_items=12):
     """Format a set/list for readable error messages."""
 
-    values = sorted(str(v) for v in values)
-    if len(values) <= max_items:
-        return ", ".join(values)
-    head = ", ".join(values[:max_items])
-    return f"{head} (+{len(values) - max_items})"
+    n = len(values)
+    if n <= max_items:
+        return ", ".join(sorted(map(str, values)))
+    # Only the first max_items are shown: no need to sort everything
+    head = ", ".join(heapq.nsmallest(max_items, map(str, values)))
+    return f"{head} (+{n - max_items})"
 
 
-def extra_validate(data):
-    """Extra (cross-field) validation that JSON Schema can't express easily."""
+def _validate_network(idx, net, toll_set, non_close_tolls):
+    """
+    Cross-check one entry of networks (tolls, connections and their prices).
 
+    Returns (errors, set of the network's tolls).
+    """
     errors = []
+    add_error = errors.append
+
+    if not isinstance(net, dict):
+        return [f"networks[{idx}]: must be an object"], set()
+
+    net_tolls = net.get("tolls", [])
+    if not isinstance(net_tolls, list):
+        add_error(f"networks[{idx}].tolls: must be an array")
+        net_tolls = []
+
+    net_toll_set = set(net_tolls)
+
+    if not net_toll_set <= toll_set:
+        unknown_net_tolls = net_toll_set - toll_set
+        add_error(
+            f"networks[{idx}].tolls: contains unknown toll(s): {_fmt_set(unknown_net_tolls)}"
+        )
+
+    # Only closed tolls should belong to closed networks
+    if not net_toll_set.isdisjoint(non_close_tolls):
+        non_close = net_toll_set & non_close_tolls
+        add_error(
+            f"networks[{idx}].tolls: contains non-close toll(s): {_fmt_set(non_close)}"
+        )
+
+    conn = net.get("connection", {})
+    if not isinstance(conn, dict):
+        add_error(f"networks[{idx}].connection: must be an object")
+        return errors, net_toll_set
+
+    for src, dsts in conn.items():
+        if src not in net_toll_set:
+            add_error(
+                f"networks[{idx}].connection: unknown source toll '{src}' (not in networks[{idx}].tolls)"
+            )
+            continue
+
+        if not isinstance(dsts, dict):
+            add_error(f"networks[{idx}].connection.{src}: must be an object")
+            continue
+
+        for dst in dsts.keys():
+            if dst not in net_toll_set:
+                add_error(
+                    f"networks[{idx}].connection.{src}: unknown destination toll '{dst}' (not in networks[{idx}].tolls)"
+                )
+
+            # Validate price for each connection
+            for problem in _price_errors(dsts[dst]):
+                add_error(f"networks[{idx}].connection.{src}.{dst}{problem}")
+
+    return errors, net_toll_set
+
+
+def extra_validate(data):
+    """
+    Extra (cross-field) validation that JSON Schema can't express easily.
+
+    Yields error messages lazily, so callers can stop after the first ones.
+    """
 
     list_of_toll = data.get("list_of_toll", [])
     toll_set = set(list_of_toll) if isinstance(list_of_toll, list) else set()
 
     # Validate toll names format (ASCII uppercase + digits + spaces + underscore + hyphen only)
-    import re
-
-    name_pattern = re.compile(r"^[A-Z0-9 _-]+$")
     for toll_name in toll_set:
-        if not name_pattern.match(toll_name):
-            errors.append(
+        if not _NAME_RE.match(toll_name):
+            yield (
                 f"list_of_toll: invalid toll name '{toll_name}' (must contain only uppercase ASCII letters, digits, spaces, underscores, and hyphens)"
             )
 
@@ -74,22 +330,25 @@ def extra_validate(data):
 
     toll_description = data.get("toll_description", {})
     if not isinstance(toll_description, dict):
-        errors.append("toll_description: must be an object")
+        yield "toll_description: must be an object"
         toll_description = {}
 
     # toll_description keys must match list_of_toll exactly
-    td_keys = set(toll_description.keys())
+    td_keys = toll_description.keys()
     missing_td = toll_set - td_keys
     extra_td = td_keys - toll_set
     if missing_td:
-        errors.append(f"toll_description: missing toll(s): {_fmt_set(missing_td)}")
+        yield f"toll_description: missing toll(s): {_fmt_set(missing_td)}"
     if extra_td:
-        errors.append(f"toll_description: unknown toll key(s): {_fmt_set(extra_td)}")
+        yield f"toll_description: unknown toll key(s): {_fmt_set(extra_td)}"
 
-    # operator must be in list_of_operator
+    # Single pass over toll_description: per-toll checks + open/close classification
+    open_tolls = set()
+    close_tolls = set()
+    non_close_tolls = set()  # described tolls whose type is not "close"
     for toll_name, desc in toll_description.items():
         if not isinstance(desc, dict):
-            errors.append(f"toll_description.{toll_name}: must be an object")
+            yield f"toll_description.{toll_name}: must be an object"
             continue
 
         # Validate OSM node_id and ways_id (at least one must be present and non-empty)
@@ -101,239 +360,214 @@ def extra_validate(data):
         has_way = ways_id and isinstance(ways_id, list) and len(ways_id) > 0
 
         if not has_node and not has_way:
-            errors.append(
+            yield (
                 f"toll_description.{toll_name}: must have at least one OSM node ID (in node_id) or one OSM way ID (in ways_id)"
             )
 
         # Validate node_id format if present
         if node_id is not None:
             if not isinstance(node_id, list):
-                errors.append(f"toll_description.{toll_name}.node_id: must be an array")
-            elif node_id and not all(
-                isinstance(n, str) and n.isdigit() for n in node_id
-            ):
-                errors.append(
+                yield f"toll_description.{toll_name}.node_id: must be an array"
+            elif node_id and not _are_digit_strings(node_id):
+                yield (
                     f"toll_description.{toll_name}.node_id: all IDs must be numeric strings"
                 )
 
         # Validate ways_id format if present
         if ways_id is not None:
             if not isinstance(ways_id, list):
-                errors.append(f"toll_description.{toll_name}.ways_id: must be an array")
-            elif ways_id and not all(
-                isinstance(w, str) and w.isdigit() for w in ways_id
-            ):
-                errors.append(
+                yield f"toll_description.{toll_name}.ways_id: must be an array"
+            elif ways_id and not _are_digit_strings(ways_id):
+                yield (
                     f"toll_description.{toll_name}.ways_id: all IDs must be numeric strings"
                 )
 
         # Validate type (required)
         toll_type = desc.get("type")
         if not toll_type or toll_type not in ["open", "close"]:
-            errors.append(
+            yield (
                 f"toll_description.{toll_name}.type: required and must be 'open' or 'close'"
             )
 
+        if toll_type == "close":
+            close_tolls.add(toll_name)
+        else:
+            non_close_tolls.add(toll_name)
+            if toll_type == "open":
+                open_tolls.add(toll_name)
+
+        # operator must be in list_of_operator
         operator = desc.get("operator")
         if operator and operator not in operator_set:
-            errors.append(
+            yield (
                 f"toll_description.{toll_name}.operator: '{operator}' is not in list_of_operator"
             )
 
-    # open/close classification derived from toll_description
-    open_tolls = set()
-    close_tolls = set()
-    for toll_name, desc in toll_description.items():
-        if not isinstance(desc, dict):
-            continue
-        t = desc.get("type")
-        if t == "open":
-            open_tolls.add(toll_name)
-        elif t == "close":
-            close_tolls.add(toll_name)
-
     # open_toll_price keys must match open tolls exactly
     open_toll_price = data.get("open_toll_price", {})
     if not isinstance(open_toll_price, dict):
-        errors.append("open_toll_price: must be an object")
+        yield "open_toll_price: must be an object"
         open_toll_price = {}
 
-    otp_keys = set(open_toll_price.keys())
-    otp_unknown = otp_keys - toll_set
-    if otp_unknown:
-        errors.append(f"open_toll_price: unknown toll key(s): {_fmt_set(otp_unknown)}")
-
-    missing_otp = open_tolls - otp_keys
-    extra_otp = otp_keys - open_tolls
-    if missing_otp:
-        errors.append(
-            f"open_toll_price: missing price for open toll(s): {_fmt_set(missing_otp)}"
-        )
-    if extra_otp:
-        errors.append(
-            f"open_toll_price: contains non-open toll(s): {_fmt_set(extra_otp)}"
-        )
+    # No open toll and no open_toll_price: nothing to check
+    if open_tolls or open_toll_price:
+        otp_keys = open_toll_price.keys()
+        otp_unknown = otp_keys - toll_set
+        if otp_unknown:
+            yield f"open_toll_price: unknown toll key(s): {_fmt_set(otp_unknown)}"
+
+        missing_otp = open_tolls - otp_keys
+        extra_otp = otp_keys - open_tolls
+        if missing_otp:
+            yield (
+                f"open_toll_price: missing price for open toll(s): {_fmt_set(missing_otp)}"
+            )
+        if extra_otp:
+            yield (
+                f"open_toll_price: contains non-open toll(s): {_fmt_set(extra_otp)}"
+            )
 
-    # Validate prices in open_toll_price
-    for toll_name, edge in open_toll_price.items():
-        if isinstance(edge, dict):
-            price = edge.get("price")
-            if not price or not isinstance(price, dict):
-                errors.append(f"open_toll_price.{toll_name}: price is required")
-            else:
-                for cls in ["class_1", "class_2", "class_3", "class_4", "class_5"]:
-                    if cls not in price:
-                        errors.append(
-                            f"open_toll_price.{toll_name}.price: missing {cls}"
-                        )
-                    elif not isinstance(price[cls], str) or not re.match(
-                        r"^\d+(\.\d+)?$", price[cls]
-                    ):
-                        errors.append(
-                            f"open_toll_price.{toll_name}.price.{cls}: must be a numeric string"
-                        )
+        # Validate prices in open_toll_price
+        for toll_name, edge in open_toll_price.items():
+            for problem in _price_errors(edge):
+                yield f"open_toll_price.{toll_name}{problem}"
 
     # networks + connections cross-checks
     networks = data.get("networks", [])
     if not isinstance(networks, list):
-        errors.append("networks: must be an array")
+        yield "networks: must be an array"
         networks = []
 
     all_network_tolls = set()
     for idx, net in enumerate(networks):
-        if not isinstance(net, dict):
-            errors.append(f"networks[{idx}]: must be an object")
-            continue
+        net_errors, net_toll_set = _validate_network(
+            idx, net, toll_set, non_close_tolls
+        )
+        yield from net_errors
+        all_network_tolls |= net_toll_set
 
-        net_tolls = net.get("tolls", [])
-        if not isinstance(net_tolls, list):
-            errors.append(f"networks[{idx}].tolls: must be an array")
-            net_tolls = []
+    # all close tolls must belong to some closed network
+    if not close_tolls <= all_network_tolls:
+        missing_close_in_networks = close_tolls - all_network_tolls
+        yield (
+            f"networks: missing close toll(s) in any network: {_fmt_set(missing_close_in_networks)}"
+        )
 
-        net_toll_set = set(net_tolls)
-        all_network_tolls |= net_toll_set
+    # open tolls should not appear in closed networks
+    if not open_tolls.isdisjoint(all_network_tolls):
+        open_in_networks = open_tolls & all_network_tolls
+        yield f"networks: contains open toll(s): {_fmt_set(open_in_networks)}"
 
-        unknown_net_tolls = net_toll_set - toll_set
-        if unknown_net_tolls:
-            errors.append(
-                f"networks[{idx}].tolls: contains unknown toll(s): {_fmt_set(unknown_net_tolls)}"
-            )
 
-        # Only closed tolls should belong to closed networks
-        non_close = sorted(
-            [
-                t
-                for t in net_toll_set
-                if isinstance(toll_description.get(t), dict)
-                and toll_description[t].get("type") != "close"
-            ]
-        )
-        if non_close:
-            errors.append(
-                f"networks[{idx}].tolls: contains non-close toll(s): {_fmt_set(non_close)}"
-            )
+def _rules_digest(schema_path):
+    """Hash of the schema and of this script: a cached result is stale if either changed."""
+    return hashlib.sha256(
+        (_sha256_file(schema_path) + _sha256_file(__file__)).encode()
+    ).hexdigest()
 
-        conn = net.get("connection", {})
-        if not isinstance(conn, dict):
-            errors.append(f"networks[{idx}].connection: must be an object")
-            continue
 
-        for src, dsts in conn.items():
-            if src not in net_toll_set:
-                errors.append(
-                    f"networks[{idx}].connection: unknown source toll '{src}' (not in networks[{idx}].tolls)"
-                )
-                continue
-
-            if not isinstance(dsts, dict):
-                errors.append(f"networks[{idx}].connection.{src}: must be an object")
-                continue
-
-            for dst in dsts.keys():
-                if dst not in net_toll_set:
-                    errors.append(
-                        f"networks[{idx}].connection.{src}: unknown destination toll '{dst}' (not in networks[{idx}].tolls)"
-                    )
-
-                # Validate price for each connection
-                edge = dsts[dst]
-                if isinstance(edge, dict):
-                    price = edge.get("price")
-                    if not price or not isinstance(price, dict):
-                        errors.append(
-                            f"networks[{idx}].connection.{src}.{dst}: price is required"
-                        )
-                    else:
-                        for cls in [
-                            "class_1",
-                            "class_2",
-                            "class_3",
-                            "class_4",
-                            "class_5",
-                        ]:
-                            if cls not in price:
-                                errors.append(
-                                    f"networks[{idx}].connection.{src}.{dst}.price: missing {cls}"
-                                )
-                            elif not isinstance(price[cls], str) or not re.match(
-                                r"^\d+(\.\d+)?$", price[cls]
-                            ):
-                                errors.append(
-                                    f"networks[{idx}].connection.{src}.{dst}.price.{cls}: must be a numeric string"
-                                )
+def _read_validated_cache():
+    try:
+        return json.loads(VALIDATED_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
-    # all close tolls must belong to some closed network
-    missing_close_in_networks = close_tolls - all_network_tolls
-    if missing_close_in_networks:
-        errors.append(
-            f"networks: missing close toll(s) in any network: {_fmt_set(missing_close_in_networks)}"
-        )
 
-    # open tolls should not appear in closed networks
-    open_in_networks = open_tolls & all_network_tolls
-    if open_in_networks:
-        errors.append(f"networks: contains open toll(s): {_fmt_set(open_in_networks)}")
+def _record_validated(data_digest, rules_digest):
+    cache = _read_validated_cache()
+    cache[data_digest] = rules_digest
+    try:
+        VALIDATED_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        VALIDATED_CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
 
-    return errors
 
+def validate_toll_json(data_path, schema_path=None, fast=False, max_errors=None):
+    """
+    Validate toll network JSON against schema.
+
+    With fast=True, a file already validated with the same schema and the same
+    version of this script (compared by SHA-256) is accepted without re-validation.
+
+    At most max_errors (>= 1) cross-field errors are reported (all of them if None).
 
-def validate_toll_json(data_path, schema_path=None):
-    """Validate toll network JSON against schema."""
+    Returns (is_valid, data) so the parsed document can be reused; data is None
+    when the file was not loaded (fast mode cache hit).
+    """
 
     # Default schema path
     if schema_path is None:
         script_dir = Path(__file__).parent
         schema_path = script_dir / "toll_network_schema.json"
 
+    fast = fast and Path(data_path).is_file() and Path(schema_path).is_file()
+    if fast:
+        data_digest = _sha256_file(data_path)
+        rules_digest = _rules_digest(schema_path)
+        if _read_validated_cache().get(data_digest) == rules_digest:
+            print(f"✅ {data_path}: déjà validé avec ce schéma (cache), validation ignorée.")
+            return True, None
+
     # Load files
     print(f"📂 Chargement du fichier de données: {data_path}")
     data = load_json(data_path)
 
     print(f"📂 Chargement du schéma: {schema_path}")
-    schema = load_json(schema_path)
 
     # Validate
     print("🔍 Validation en cours...")
     try:
-        validate(instance=data, schema=schema)
-        extra_errors = extra_validate(data)
-        if extra_errors:
-            print(
-                "❌ Erreur de validation (contraintes supplementaires):",
-                file=sys.stderr,
-            )
-            for msg in extra_errors:
-                print(f"   - {msg}", file=sys.stderr)
-            return False
+        validate = get_validator(schema_path)
+        validate(data)
+        # Print errors as they are produced, stop after max_errors of them
+        n_extra_errors = 0
+        for msg in extra_validate(data):
+            if not n_extra_errors:
+                print(
+                    "❌ Erreur de validation (contraintes supplementaires):",
+                    file=sys.stderr,
+                )
+            n_extra_errors += 1
+            print(f"   - {msg}", file=sys.stderr)
+            if max_errors is not None and n_extra_errors >= max_errors:
+                break
+        if n_extra_errors:
+            return False, data
 
         print("✅ Validation réussie! Le fichier JSON est conforme au schéma.")
-        return True
+        # Reached only after a full pass with no error (the loop breaks on errors)
+        if fast:
+            _record_validated(data_digest, rules_digest)
+        return True, data
     except SchemaError as e:
         print("❌ Erreur dans le schéma JSON:", file=sys.stderr)
         print(f"   {e.message}", file=sys.stderr)
         if e.path:
             print(f"   Chemin: {' -> '.join(str(p) for p in e.path)}", file=sys.stderr)
-        return False
+        return False, data
+    except _FAST_SCHEMA_ERRORS as e:
+        print("❌ Erreur dans le schéma JSON:", file=sys.stderr)
+        print(f"   {e}", file=sys.stderr)
+        return False, data
+    except _FAST_VALIDATION_ERRORS as e:
+        print("❌ Erreur de validation:", file=sys.stderr)
+        print(f"   {e.message}", file=sys.stderr)
+        # fastjsonschema prefixes the path with the "data" root
+        path = e.path[1:] if e.path else []
+        if path:
+            print(
+                f"   Chemin dans le document: {' -> '.join(str(p) for p in path)}",
+                file=sys.stderr,
+            )
+        if e.rule:
+            print(f"   Règle du schéma: {e.rule}", file=sys.stderr)
+
+        # Show the problematic value if available
+        if e.value is not None and not isinstance(e.value, (dict, list)):
+            print(f"   Valeur problématique: {e.value}", file=sys.stderr)
+
+        return False, data
     except ValidationError as e:
         print("❌ Erreur de validation:", file=sys.stderr)
         print(f"   {e.message}", file=sys.stderr)
@@ -352,7 +586,7 @@ def validate_toll_json(data_path, schema_path=None):
         if e.instance is not None and not isinstance(e.instance, (dict, list)):
             print(f"   Valeur problématique: {e.instance}", file=sys.stderr)
 
-        return False
+        return False, data
 
 
 def print_summary(data):
@@ -374,14 +608,23 @@ def print_summary(data):
         for net in networks:
             network_name = net.get("network_name", "unknown")
             num_tolls = len(net.get("tolls", []))
-            num_connections = sum(
-                len(conns) for conns in net.get("connection", {}).values()
-            )
+            num_connections = sum(map(len, net.get("connection", {}).values()))
             print(
                 f"     • {network_name}: {num_tolls} péages, {num_connections} connexions"
             )
 
 
+def _positive_int(value):
+    """argparse type for options that must be an integer >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"entier >= 1 attendu, reçu '{value}'")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Valider un fichier JSON de réseau de péages contre le schéma JSON Schema."
@@ -399,16 +642,30 @@ def main():
         action="store_true",
         help="Afficher un résumé des données après validation",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Ne pas revalider un fichier identique déjà validé avec le même schéma",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=_positive_int,
+        metavar="N",
+        help="Arrêter après N erreurs de contraintes supplémentaires (toutes par défaut)",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Mode verbeux")
 
     args = parser.parse_args()
 
     # Validate
-    is_valid = validate_toll_json(args.data_file, args.schema)
+    is_valid, data = validate_toll_json(
+        args.data_file, args.schema, fast=args.fast, max_errors=args.max_errors
+    )
 
     # Print summary if requested and validation succeeded
     if is_valid and args.summary:
-        data = load_json(args.data_file)
+        if data is None:
+            data = load_json(args.data_file)
         print_summary(data)
 
     # Exit with appropriate code
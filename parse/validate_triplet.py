@@ -14,9 +14,10 @@ Utilisation:
 """
 
 import csv
+import io
 import sys
 from pathlib import Path
-from typing import Set, Tuple
+from typing import Set, TextIO, Tuple
 
 
 class TripletValidationError(Exception):
@@ -25,85 +26,116 @@ class TripletValidationError(Exception):
     pass
 
 
-def detect_delimiter(file_path: str) -> str:
+def detect_delimiter(f: TextIO) -> str:
     """
-    Détecte automatiquement le délimiteur d'un fichier CSV.
+    Détecte automatiquement le délimiteur d'un fichier CSV déjà ouvert.
+
+    La première ligne est lue puis le fichier est replacé au début.
 
     Args:
-        file_path: Chemin du fichier CSV
+        f: Fichier CSV ouvert en lecture
 
     Returns:
         Le délimiteur détecté (';' ou ',')
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        first_line = f.readline()
-        if ";" in first_line:
-            return ";"
-        elif "," in first_line:
-            return ","
-        else:
-            return ";"
+    first_line = f.readline()
+    f.seek(0)
+    if ";" in first_line:
+        return ";"
+    elif "," in first_line:
+        return ","
+    else:
+        return ";"
 
 
-def extract_names_from_close(file_path: str) -> Set[str]:
+def _extract_names(file_path: str, columns: Tuple[str, ...]) -> Set[str]:
     """
-    Extrait tous les noms de stations du fichier close (name_from et name_to).
+    Extrait les valeurs non vides des colonnes données d'un fichier CSV.
+
+    Les colonnes sont repérées une fois dans l'en-tête puis lues par position,
+    sans construire de dictionnaire par ligne. Sans guillemets dans le fichier
+    (cas des CSV générés), les lignes sont découpées directement en octets ;
+    sinon le module csv interprète les champs.
 
     Args:
-        file_path: Chemin du fichier CSV close
+        file_path: Chemin du fichier CSV
+        columns: Noms des colonnes à extraire
 
     Returns:
-        Ensemble des noms de stations
+        Ensemble des valeurs trouvées
     """
     names = set()
 
-    if not Path(file_path).exists():
-        return names  # Fichier n'existe pas, retourner ensemble vide
-
-    delimiter = detect_delimiter(file_path)
+    with open(file_path, "rb") as f:
+        data = f.read()
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
+    if b'"' in data:
+        # Les octets déjà lus sont décodés, sans rouvrir le fichier
+        f = io.StringIO(data.decode("utf-8"), newline="")
+        reader = csv.reader(f, delimiter=detect_delimiter(f))
+        header = next(reader, [])
+        indexes = [header.index(col) for col in columns if col in header]
 
         for row in reader:
-            name_from = row.get("name_from", "").strip()
-            name_to = row.get("name_to", "").strip()
-
-            if name_from:
-                names.add(name_from)
-            if name_to:
-                names.add(name_to)
+            for i in indexes:
+                if i < len(row):
+                    name = row[i].strip()
+                    if name:
+                        names.add(name)
+
+        return names
+
+    # bytes.splitlines coupe sur \n, \r et \r\n, comme csv.reader
+    lines = data.splitlines()
+    if not lines:
+        return names
+    first_line = lines[0].decode("utf-8")
+    delimiter = detect_delimiter(io.StringIO(first_line))
+    header = first_line.split(delimiter)
+    indexes = [header.index(col) for col in columns if col in header]
+    sep = delimiter.encode()
+
+    for line in lines[1:]:
+        fields = line.split(sep)
+        for i in indexes:
+            if i < len(fields):
+                name = fields[i].decode("utf-8").strip()
+                if name:
+                    names.add(name)
 
     return names
 
 
-def extract_names_from_open(file_path: str) -> Set[str]:
+def extract_names_from_close(file_path: str) -> Set[str]:
     """
-    Extrait tous les noms de stations du fichier open.
+    Extrait tous les noms de stations du fichier close (name_from et name_to).
 
     Args:
-        file_path: Chemin du fichier CSV open
+        file_path: Chemin du fichier CSV close
 
     Returns:
         Ensemble des noms de stations
     """
-    names = set()
-
     if not Path(file_path).exists():
-        return names  # Fichier n'existe pas, retourner ensemble vide
+        return set()  # Fichier n'existe pas, retourner ensemble vide
 
-    delimiter = detect_delimiter(file_path)
+    return _extract_names(file_path, ("name_from", "name_to"))
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
 
-        for row in reader:
-            name = row.get("name", "").strip()
+def extract_names_from_open(file_path: str) -> Set[str]:
+    """
+    Extrait tous les noms de stations du fichier open.
 
-            if name:
-                names.add(name)
+    Args:
+        file_path: Chemin du fichier CSV open
 
-    return names
+    Returns:
+        Ensemble des noms de stations
+    """
+    if not Path(file_path).exists():
+        return set()  # Fichier n'existe pas, retourner ensemble vide
+
+    return _extract_names(file_path, ("name",))
 
 
 def extract_names_from_toll_info(file_path: str) -> Set[str]:
@@ -116,23 +148,10 @@ def extract_names_from_toll_info(file_path: str) -> Set[str]:
     Returns:
         Ensemble des noms de stations
     """
-    names = set()
-
     if not Path(file_path).exists():
         raise FileNotFoundError(f"Fichier toll_info introuvable: {file_path}")
 
-    delimiter = detect_delimiter(file_path)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=delimiter)
-
-        for row in reader:
-            name = row.get("name", "").strip()
-
-            if name:
-                names.add(name)
-
-    return names
+    return _extract_names(file_path, ("name",))
 
 
 def validate_triplet(close_csv: str, open_csv: str, toll_info_csv: str) -> bool: